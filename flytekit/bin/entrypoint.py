@@ -47,20 +47,30 @@ def get_version_message():
     return f"Welcome to Flyte! Version: {flytekit.__version__}"
 
 
-def _compute_array_job_index():
-    # type () -> int
+def _compute_array_job_indices():
+    # type () -> range
     """
-    Computes the absolute index of the current array job. This is determined by summing the compute-environment-specific
-    environment variable and the offset (if one's set). The offset will be set and used when the user request that the
-    job runs in a number of slots less than the size of the input.
-    :rtype: int
+    Computes the absolute indices of the array jobs handled by the current container. A single container can process a
+    batch of BATCH_JOB_ARRAY_INDEX_COUNT indices (defaults to 1), which amortizes container startup across several
+    inputs. Batches never overlap:
+
+        - By default batches are contiguous: array job ``k`` handles ``[k * count, (k + 1) * count)``.
+        - If BATCH_JOB_ARRAY_STRIDE is set, batches are strided: array job ``k`` handles ``k, k + stride, ...``. The
+          stride must then be the number of array jobs.
+
+    Batching does not change the size of the array job, so whoever launches it is responsible for starting only
+    ``ceil(len(inputs) / count)`` array jobs (or ``stride`` array jobs when strided). Indices past the end of the inputs
+    in the last batch are skipped by _execute_map_task_batch.
+    :rtype: range
     """
-    offset = 0
-    if _os.environ.get("BATCH_JOB_ARRAY_INDEX_OFFSET"):
-        offset = int(_os.environ.get("BATCH_JOB_ARRAY_INDEX_OFFSET"))
-    if _os.environ.get("BATCH_JOB_ARRAY_INDEX_VAR_NAME"):
-        return offset + int(_os.environ.get(_os.environ.get("BATCH_JOB_ARRAY_INDEX_VAR_NAME")))
-    return offset
+    count = int(_os.environ.get("BATCH_JOB_ARRAY_INDEX_COUNT") or 1)
+    raw_stride = _os.environ.get("BATCH_JOB_ARRAY_STRIDE")
+    if raw_stride:
+        stride = int(raw_stride)
+        start = MapPythonTask._compute_array_job_index()
+        return range(start, start + count * stride, stride)
+    start = MapPythonTask._compute_array_job_index(batch_size=count)
+    return range(start, start + count)
 
 
 def _dispatch_execute(
@@ -382,18 +392,114 @@ def _execute_map_task(
                 raise Exception("Map tasks cannot be run with instance tasks.")
             map_task = MapPythonTask(_task_def, max_concurrency)
 
-            task_index = _compute_array_job_index()
-            output_prefix = _os.path.join(output_prefix, str(task_index))
+            task_indices = _compute_array_job_indices()
 
             if test:
                 logger.info(
-                    f"Test detected, returning. Inputs: {inputs} Computed task index: {task_index} "
-                    f"New output prefix: {output_prefix} Raw output path: {raw_output_data_prefix} "
+                    f"Test detected, returning. Inputs: {inputs} Computed task indices: {list(task_indices)} "
+                    f"Output prefix: {output_prefix} Raw output path: {raw_output_data_prefix} "
                     f"Resolver and args: {resolver} {resolver_args}"
                 )
                 return
 
-            _handle_annotated_task(ctx, map_task, inputs, output_prefix)
+            if len(task_indices) == 1:
+                with map_task.array_job_index(task_indices[0]):
+                    _handle_annotated_task(ctx, map_task, inputs, _os.path.join(output_prefix, str(task_indices[0])))
+                return
+
+            _execute_map_task_batch(
+                ctx, map_task, inputs, output_prefix, task_indices, checkpoint_path, prev_checkpoint
+            )
+
+
+@contextlib.contextmanager
+def _array_job_index_context(
+    ctx: FlyteContext,
+    task_index: int,
+    checkpoint_path: Optional[str] = None,
+    prev_checkpoint: Optional[str] = None,
+):
+    """
+    Yields a context for a single array job index of a batch, with its own working and engine directories and its own
+    checkpoint sub-path.
+    """
+    index_dir = ctx.file_access.get_random_local_directory()
+    user_space_params = ctx.execution_state.user_space_params
+    if checkpoint_path is not None:
+        b = ExecutionParameters.new_builder(user_space_params)
+        b.checkpoint = SyncCheckpoint(
+            checkpoint_dest=_os.path.join(checkpoint_path, str(task_index)),
+            checkpoint_src=_os.path.join(prev_checkpoint, str(task_index)) if prev_checkpoint else None,
+        )
+        user_space_params = b.build()
+    execution_state = ctx.execution_state.with_params(
+        working_dir=index_dir,
+        engine_dir=_os.path.join(index_dir, "engine_dir"),
+        user_space_params=user_space_params,
+    )
+    with FlyteContextManager.with_context(ctx.with_execution_state(execution_state)) as index_ctx:
+        yield index_ctx
+
+
+def _execute_map_task_batch(
+    ctx: FlyteContext,
+    map_task: MapPythonTask,
+    inputs: str,
+    output_prefix: str,
+    task_indices: range,
+    checkpoint_path: Optional[str] = None,
+    prev_checkpoint: Optional[str] = None,
+):
+    """
+    Runs a batch of array job indices in the current container. Each index is executed exactly as if it had been run by
+    a separate array job: it gets its own working and engine directories, its own checkpoint sub-path and writes its
+    outputs under its own output prefix. The inputs are downloaded once for the whole batch, and indices past the end of
+    the input collection are skipped, since the last batch of an array job may not be full. If the inputs cannot be
+    read, a recoverable system error is recorded for every index of the batch, the same way _dispatch_execute would.
+    """
+    local_inputs_file = _os.path.join(ctx.execution_state.working_dir, "batch_inputs.pb")
+    try:
+        ctx.file_access.get_data(inputs, local_inputs_file)
+        input_proto = utils.load_proto_from_file(_literals_pb2.LiteralMap, local_inputs_file)
+        input_collections = [
+            literal.collection.literals
+            for literal in _literal_models.LiteralMap.from_flyte_idl(input_proto).literals.values()
+            if literal.collection is not None
+        ]
+    except Exception as e:
+        exc_str = _traceback.format_exc()
+        logger.error(f"Exception when reading the inputs of map task {map_task.name}, reason {str(e)}")
+        logger.error("!! Begin Unknown System Error Captured by Flyte !!")
+        logger.error(exc_str)
+        logger.error("!! End Error Captured by Flyte !!")
+        error_document = _error_models.ErrorDocument(
+            _error_models.ContainerError(
+                "SYSTEM:Unknown",
+                exc_str,
+                _error_models.ContainerError.Kind.RECOVERABLE,
+                _execution_models.ExecutionError.ErrorKind.SYSTEM,
+            )
+        )
+        for task_index in task_indices:
+            with _array_job_index_context(ctx, task_index) as index_ctx:
+                engine_dir = index_ctx.execution_state.engine_dir
+                utils.write_proto_to_file(
+                    error_document.to_flyte_idl(), _os.path.join(engine_dir, _constants.ERROR_FILE_NAME)
+                )
+                index_ctx.file_access.put_data(
+                    engine_dir, _os.path.join(output_prefix, str(task_index)), is_multipart=True
+                )
+        return
+
+    if input_collections:
+        task_indices = range(task_indices.start, min(task_indices.stop, len(input_collections[0])), task_indices.step)
+
+    for task_index in task_indices:
+        with _array_job_index_context(ctx, task_index, checkpoint_path, prev_checkpoint) as index_ctx:
+            with map_task.array_job_index(task_index):
+                _handle_annotated_task(
+                    index_ctx, map_task, local_inputs_file, _os.path.join(output_prefix, str(task_index))
+                )
 
 
 def normalize_inputs(
@@ -4,6 +4,7 @@ a reference task as well as run-time parameters that limit execution concurrency
 """
 
 import os
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from itertools import count
 from typing import Any, Dict, List, Optional, Type
@@ -18,6 +19,22 @@ from flytekit.models.array_job import ArrayJob
 from flytekit.models.interface import Variable
 from flytekit.models.task import Container, K8sPod, Sql
 
+# The leading pyflyte-map-execute arguments are template placeholders filled in by the platform, so they're the same for
+# every map task and are only built once.
+_MAP_EXECUTE_ARGS = (
+    "pyflyte-map-execute",
+    "--inputs",
+    "{{.input}}",
+    "--output-prefix",
+    "{{.outputPrefix}}",
+    "--raw-output-data-prefix",
+    "{{.rawOutputDataPrefix}}",
+    "--checkpoint-path",
+    "{{.checkpointOutputPrefix}}",
+    "--prev-checkpoint",
+    "{{.prevCheckpointPrefix}}",
+)
+
 
 class MapPythonTask(PythonTask):
     """
@@ -30,6 +47,17 @@ class MapPythonTask(PythonTask):
     # MapPythonTask instances to uniquely differentiate map task names for each declared instance.
     _ids = count(0)
 
+    # Parent classes keep a __dict__, but the attributes read on every execution get fixed slots.
+    __slots__ = (
+        "_run_task",
+        "_max_concurrency",
+        "_min_success_ratio",
+        "_array_task_interface",
+        "_array_job_index",
+        "_any_input_key",
+        "_input_keys",
+    )
+
     def __init__(
         self,
         python_function_task: PythonFunctionTask,
@@ -58,6 +86,11 @@ class MapPythonTask(PythonTask):
         self._max_concurrency = concurrency
         self._min_success_ratio = min_success_ratio
         self._array_task_interface = python_function_task.python_interface
+        self._array_job_index = None
+        # The input schema is fixed, so the keys used to slice mapped inputs are resolved once here rather than on
+        # every execution.
+        self._any_input_key = next(iter(python_function_task.interface.inputs), None)
+        self._input_keys = tuple(collection_interface.inputs.keys())
         if "metadata" not in kwargs and python_function_task.metadata:
             kwargs["metadata"] = python_function_task.metadata
         super().__init__(
@@ -71,17 +104,7 @@ class MapPythonTask(PythonTask):
 
     def get_command(self, settings: SerializationSettings) -> List[str]:
         container_args = [
-            "pyflyte-map-execute",
-            "--inputs",
-            "{{.input}}",
-            "--output-prefix",
-            "{{.outputPrefix}}",
-            "--raw-output-data-prefix",
-            "{{.rawOutputDataPrefix}}",
-            "--checkpoint-path",
-            "{{.checkpointOutputPrefix}}",
-            "--prev-checkpoint",
-            "{{.prevCheckpointPrefix}}",
+            *_MAP_EXECUTE_ARGS,
             "--resolver",
             self._run_task.task_resolver.location,
             "--",
@@ -101,6 +124,18 @@ class MapPythonTask(PythonTask):
         finally:
             self._run_task.reset_command_fn()
 
+    @contextmanager
+    def array_job_index(self, index: int):
+        """
+        Pins the array job index this map task executes for, rather than computing it from the environment. This is
+        used when a single container processes a batch of array job indices.
+        """
+        self._array_job_index = index
+        try:
+            yield
+        finally:
+            self._array_job_index = None
+
     def get_container(self, settings: SerializationSettings) -> Container:
         with self.prepare_target():
             return self._run_task.get_container(settings)
@@ -131,15 +166,17 @@ class MapPythonTask(PythonTask):
         return self._raw_execute(**kwargs)
 
     @staticmethod
-    def _compute_array_job_index() -> int:
+    def _compute_array_job_index(batch_size: int = 1) -> int:
         """
         Computes the absolute index of the current array job. This is determined by summing the compute-environment-specific
         environment variable and the offset (if one's set). The offset will be set and used when the user request that the
-        job runs in a number of slots less than the size of the input.
+        job runs in a number of slots less than the size of the input. When every array job handles a contiguous batch of
+        ``batch_size`` indices, the returned index is the first index of the current job's batch.
         """
-        return int(os.environ.get("BATCH_JOB_ARRAY_INDEX_OFFSET", 0)) + int(
-            os.environ.get(os.environ.get("BATCH_JOB_ARRAY_INDEX_VAR_NAME"))
-        )
+        env = os.environ
+        raw_offset = env.get("BATCH_JOB_ARRAY_INDEX_OFFSET")
+        offset = int(raw_offset) if raw_offset else 0
+        return offset + int(env[env["BATCH_JOB_ARRAY_INDEX_VAR_NAME"]]) * batch_size
 
     @property
     def _outputs_interface(self) -> Dict[Any, Variable]:
@@ -176,10 +213,8 @@ class MapPythonTask(PythonTask):
         only produce a single output based on the map task (array task) instance. The array plugin handler will actually
         create a collection from these individual outputs as the final map task output value.
         """
-        task_index = self._compute_array_job_index()
-        map_task_inputs = {}
-        for k in self.interface.inputs.keys():
-            map_task_inputs[k] = kwargs[k][task_index]
+        task_index = self._array_job_index if self._array_job_index is not None else self._compute_array_job_index()
+        map_task_inputs = {k: kwargs[k][task_index] for k in self._input_keys}
         return exception_scopes.user_entry_point(self._run_task.execute)(**map_task_inputs)
 
     def _raw_execute(self, **kwargs) -> Any:
@@ -190,23 +225,43 @@ class MapPythonTask(PythonTask):
         outputs_expected = True
         if not self.interface.outputs:
             outputs_expected = False
-        outputs = []
 
-        any_input_key = (
-            list(self._run_task.interface.inputs.keys())[0]
-            if self._run_task.interface.inputs.items() is not None
-            else None
-        )
+        n = len(kwargs[self._any_input_key])
+        input_vectors = [kwargs[k] for k in self._input_keys]
+        single_instance_inputs_list = [
+            dict(zip(self._input_keys, (vector[i] for vector in input_vectors))) for i in range(n)
+        ]
 
-        for i in range(len(kwargs[any_input_key])):
-            single_instance_inputs = {}
-            for k in self.interface.inputs.keys():
-                single_instance_inputs[k] = kwargs[k][i]
-            o = exception_scopes.user_entry_point(self._run_task.execute)(**single_instance_inputs)
-            if outputs_expected:
-                outputs.append(o)
+        outputs = exception_scopes.user_entry_point(self._execute_instances)(single_instance_inputs_list)
+        return outputs if outputs_expected else []
 
-        return outputs
+    def _execute_instances(self, single_instance_inputs_list: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Runs the mapped instances and returns their outputs in input order. Instances run serially unless a concurrency
+        greater than one was explicitly set and the mapped task is a plain function task, in which case they run on a
+        thread pool of that size. Dynamic tasks always run serially: they compile and execute sub-workflows by pushing
+        onto the process-wide FlyteContextManager stack, which cannot be shared across threads.
+        """
+        if (
+            not self._max_concurrency
+            or self._max_concurrency <= 1
+            or self._run_task.execution_mode != PythonFunctionTask.ExecutionBehavior.DEFAULT
+        ):
+            return [self._run_task.execute(**inputs) for inputs in single_instance_inputs_list]
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+            futures = [executor.submit(self._run_task.execute, **inputs) for inputs in single_instance_inputs_list]
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            # Like the serial loop, stop at the first failure: instances that haven't started yet are cancelled, the
+            # ones already running are waited for, and the error of the lowest-index failed instance is raised. The
+            # pool starts instances in input order, so this is the error the serial loop would have raised.
+            for f in not_done:
+                f.cancel()
+            wait(futures)
+            for f in futures:
+                if not f.cancelled() and f.exception() is not None:
+                    raise f.exception()
+            return [f.result() for f in futures]
 
 
 def map_task(task_function: PythonFunctionTask, concurrency: int = 0, min_success_ratio: float = 1.0, **kwargs):
@@ -231,7 +286,8 @@ def map_task(task_function: PythonFunctionTask, concurrency: int = 0, min_succes
     :param task_function: This argument is implicitly passed and represents the repeatable function
     :param concurrency: If specified, this limits the number of mapped tasks than can run in parallel to the given batch
         size. If the size of the input exceeds the concurrency value, then multiple batches will be run serially until
-        all inputs are processed. If left unspecified, this means unbounded concurrency.
+        all inputs are processed. If left unspecified, this means unbounded concurrency. When run locally, mapped
+        instances only run in parallel if the concurrency is explicitly set to a value greater than one.
     :param min_success_ratio: If specified, this determines the minimum fraction of total jobs which can complete
         successfully before terminating this task and marking it successful.
 
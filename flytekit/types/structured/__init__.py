@@ -1,3 +1,5 @@
+from importlib.util import find_spec
+
 from flytekit.configuration.sdk import USE_STRUCTURED_DATASET
 from flytekit.loggers import logger
 
@@ -10,13 +12,21 @@ if USE_STRUCTURED_DATASET.get():
     )
 
     try:
+        # Only look the google cloud packages up here, the bigquery handlers import them the first time they're used.
+        bigquery_installed = (
+            find_spec("google.cloud.bigquery") is not None and find_spec("google.cloud.bigquery_storage") is not None
+        )
+    except ImportError:
+        bigquery_installed = False
+
+    if bigquery_installed:
         from .bigquery import (
             ArrowToBQEncodingHandlers,
             BQToArrowDecodingHandler,
             BQToPandasDecodingHandler,
             PandasToBQEncodingHandlers,
         )
-    except ImportError:
+    else:
         logger.info(
             "We won't register bigquery handler for structured dataset because "
             "we can't find the packages google-cloud-bigquery-storage and google-cloud-bigquery"
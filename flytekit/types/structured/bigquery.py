@@ -1,10 +1,13 @@
+import functools
+import io
+import os
 import re
 import typing
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import pyarrow as pa
-from google.cloud import bigquery, bigquery_storage
-from google.cloud.bigquery_storage_v1 import types
+import pyarrow.parquet as pq
 
 from flytekit import FlyteContext
 from flytekit.models import literals
@@ -19,20 +22,57 @@ from flytekit.types.structured.structured_dataset import (
     StructuredDatasetTransformerEngine,
 )
 
+# The google cloud client libraries pull in grpc, protobuf descriptors and auth, which is costly at import time. They're
+# only imported when a BigQuery handler is actually used.
+if typing.TYPE_CHECKING:
+    from google.cloud import bigquery, bigquery_storage
+
+# Matches bq://<project>:<dataset>.<table> as well as bq://<project>.<dataset>.<table>
+_BQ_URI_RE = re.compile(r"^bq://([^:.]+)[:.]([^.]+)\.(.+)$")
+
+
+# Clients are expensive to construct (credential discovery, channel setup) and safe to share across threads, so one of
+# each is reused for the lifetime of the process.
+@functools.lru_cache(maxsize=1)
+def _bq_client() -> "bigquery.Client":
+    from google.cloud import bigquery
+
+    return bigquery.Client()
+
+
+@functools.lru_cache(maxsize=1)
+def _bq_read_client() -> "bigquery_storage.BigQueryReadClient":
+    from google.cloud import bigquery_storage
+
+    return bigquery_storage.BigQueryReadClient()
+
 
 def _write_to_bq(structured_dataset: StructuredDataset):
+    from google.cloud import bigquery
+
     table_id = typing.cast(str, structured_dataset.uri).split("://", 1)[1].replace(":", ".")
-    client = bigquery.Client()
+    client = _bq_client()
     df = structured_dataset.dataframe
     if isinstance(df, pa.Table):
-        df = df.to_pandas()
-    client.load_table_from_dataframe(df, table_id)
+        # Arrow tables are uploaded as parquet directly, rather than being converted to pandas first.
+        buf = io.BytesIO()
+        pq.write_table(df, buf, compression="snappy")
+        buf.seek(0)
+        job_config = bigquery.LoadJobConfig(source_format=bigquery.SourceFormat.PARQUET)
+        client.load_table_from_file(buf, table_id, job_config=job_config)
+    else:
+        client.load_table_from_dataframe(df, table_id)
 
 
-def _read_from_bq(flyte_value: literals.StructuredDataset) -> pd.DataFrame:
+def _read_from_bq_arrow(flyte_value: literals.StructuredDataset) -> pa.Table:
+    from google.cloud.bigquery_storage_v1 import types
+
     path = flyte_value.uri
-    _, project_id, dataset_id, table_id = re.split("\\.|://|:", path)
-    client = bigquery_storage.BigQueryReadClient()
+    m = _BQ_URI_RE.match(path)
+    if m is None:
+        raise ValueError(f"BigQuery uri {path} should be of the form bq://<project>:<dataset>.<table>")
+    project_id, dataset_id, table_id = m.groups()
+    client = _bq_read_client()
     table = f"projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
     parent = "projects/{}".format(project_id)
 
@@ -44,14 +84,21 @@ def _read_from_bq(flyte_value: literals.StructuredDataset) -> pd.DataFrame:
         read_options = types.ReadSession.TableReadOptions(selected_fields=columns)
 
     requested_session = types.ReadSession(table=table, data_format=types.DataFormat.ARROW, read_options=read_options)
-    read_session = client.create_read_session(parent=parent, read_session=requested_session)
+    read_session = client.create_read_session(
+        parent=parent, read_session=requested_session, max_stream_count=os.cpu_count()
+    )
+    if not read_session.streams:
+        # Empty tables don't get any streams, but the session still carries their schema.
+        schema = pa.ipc.read_schema(pa.py_buffer(read_session.arrow_schema.serialized_schema))
+        return schema.empty_table()
+
+    def _read_stream(stream: types.ReadStream) -> pa.Table:
+        return client.read_rows(stream.name).rows(read_session).to_arrow()
 
-    stream = read_session.streams[0]
-    reader = client.read_rows(stream.name)
-    frames = []
-    for message in reader.rows().pages:
-        frames.append(message.to_dataframe())
-    return pd.concat(frames)
+    # Streams are independent and reading them is I/O bound, so they're read concurrently.
+    with ThreadPoolExecutor(max_workers=len(read_session.streams)) as executor:
+        tables = list(executor.map(_read_stream, read_session.streams))
+    return pa.concat_tables(tables)
 
 
 class PandasToBQEncodingHandlers(StructuredDatasetEncoder):
@@ -79,7 +126,9 @@ class BQToPandasDecodingHandler(StructuredDatasetDecoder):
         ctx: FlyteContext,
         flyte_value: literals.StructuredDataset,
     ) -> typing.Union[DF, typing.Generator[DF, None, None]]:
-        return _read_from_bq(flyte_value)
+        # Streams are stitched together at the Arrow level, so the only pandas materialization happens here. Splitting
+        # blocks avoids consolidating columns into a single block, which would otherwise copy the whole table again.
+        return _read_from_bq_arrow(flyte_value).to_pandas(self_destruct=True, split_blocks=True)
 
 
 class ArrowToBQEncodingHandlers(StructuredDatasetEncoder):
@@ -107,7 +156,7 @@ class BQToArrowDecodingHandler(StructuredDatasetDecoder):
         ctx: FlyteContext,
         flyte_value: literals.StructuredDataset,
     ) -> typing.Union[DF, typing.Generator[DF, None, None]]:
-        return pa.Table.from_pandas(_read_from_bq(flyte_value))
+        return _read_from_bq_arrow(flyte_value)
 
 
 StructuredDatasetTransformerEngine.register(PandasToBQEncodingHandlers(), default_for_type=False)
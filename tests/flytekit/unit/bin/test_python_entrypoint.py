@@ -1,3 +1,4 @@
+import os
 import typing
 from collections import OrderedDict
 
@@ -5,8 +6,14 @@ import mock
 import pytest
 from flyteidl.core.errors_pb2 import ErrorDocument
 
-from flytekit.bin.entrypoint import _dispatch_execute, normalize_inputs, setup_execution
-from flytekit.core import context_manager
+from flytekit.bin.entrypoint import (
+    _compute_array_job_indices,
+    _dispatch_execute,
+    _execute_map_task,
+    normalize_inputs,
+    setup_execution,
+)
+from flytekit.core import context_manager, utils
 from flytekit.core.base_task import IgnoreOutputs
 from flytekit.core.dynamic_workflow_task import dynamic
 from flytekit.core.promise import VoidPromise
@@ -300,3 +307,113 @@ def test_normalize_inputs():
     assert normalize_inputs("/raw", "/cp1", '""') == ("/raw", "/cp1", None)
     assert normalize_inputs("/raw", "/cp1", "") == ("/raw", "/cp1", None)
     assert normalize_inputs("/raw", "/cp1", "/prev") == ("/raw", "/cp1", "/prev")
+
+
+@mock.patch.dict(
+    "os.environ", {"BATCH_JOB_ARRAY_INDEX_VAR_NAME": "AWS_BATCH_JOB_ARRAY_INDEX", "AWS_BATCH_JOB_ARRAY_INDEX": "2"}
+)
+def test_compute_array_job_indices():
+    assert list(_compute_array_job_indices()) == [2]
+
+    with mock.patch.dict("os.environ", {"BATCH_JOB_ARRAY_INDEX_COUNT": "3"}):
+        assert list(_compute_array_job_indices()) == [6, 7, 8]
+
+    with mock.patch.dict("os.environ", {"BATCH_JOB_ARRAY_INDEX_COUNT": "3", "BATCH_JOB_ARRAY_INDEX_OFFSET": "1"}):
+        assert list(_compute_array_job_indices()) == [7, 8, 9]
+
+    with mock.patch.dict("os.environ", {"BATCH_JOB_ARRAY_INDEX_COUNT": "3", "BATCH_JOB_ARRAY_STRIDE": "4"}):
+        assert list(_compute_array_job_indices()) == [2, 6, 10]
+
+    with mock.patch.dict("os.environ", {}, clear=True):
+        with pytest.raises(KeyError):
+            _compute_array_job_indices()
+
+
+@pytest.mark.parametrize("layout", [{}, {"BATCH_JOB_ARRAY_STRIDE": "3"}])
+def test_compute_array_job_indices_cover_inputs_once(layout):
+    # 10 inputs batched 4 at a time only need ceil(10 / 4) = 3 array jobs, which together handle every index once.
+    indices = []
+    for array_index in range(3):
+        env = {
+            "BATCH_JOB_ARRAY_INDEX_VAR_NAME": "AWS_BATCH_JOB_ARRAY_INDEX",
+            "AWS_BATCH_JOB_ARRAY_INDEX": str(array_index),
+            "BATCH_JOB_ARRAY_INDEX_COUNT": "4",
+            **layout,
+        }
+        with mock.patch.dict("os.environ", env):
+            indices.extend(_compute_array_job_indices())
+    assert sorted(indices) == list(range(12))
+
+
+@mock.patch.dict(
+    "os.environ",
+    {
+        "BATCH_JOB_ARRAY_INDEX_VAR_NAME": "AWS_BATCH_JOB_ARRAY_INDEX",
+        "AWS_BATCH_JOB_ARRAY_INDEX": "0",
+        "BATCH_JOB_ARRAY_INDEX_COUNT": "3",
+    },
+)
+@mock.patch("flytekit.bin.entrypoint.load_object_from_module")
+def test_execute_map_task_batch(mock_load_object, tmp_path):
+    @task
+    def non_negative(a: int) -> int:
+        if a < 0:
+            raise ValueError("negative input")
+        return a
+
+    mock_load_object.return_value.load_task.return_value = non_negative
+
+    ctx = context_manager.FlyteContextManager.current_context()
+    lm = TypeEngine.dict_to_literal_map(ctx, {"a": [-1, 5]}, {"a": typing.List[int]})
+    inputs = tmp_path / "inputs.pb"
+    utils.write_proto_to_file(lm.to_flyte_idl(), str(inputs))
+    output_prefix = tmp_path / "outputs"
+
+    _execute_map_task(
+        inputs=str(inputs),
+        output_prefix=str(output_prefix),
+        raw_output_data_prefix=str(tmp_path / "raw"),
+        max_concurrency=None,
+        test=False,
+        resolver="resolver",
+        resolver_args=["task-module", "test", "task-name", "non_negative"],
+    )
+
+    # Every index only gets its own outputs, and indices past the end of the inputs are skipped.
+    assert os.listdir(output_prefix / "0") == ["error.pb"]
+    assert os.listdir(output_prefix / "1") == ["outputs.pb"]
+    assert not (output_prefix / "2").exists()
+
+
+@mock.patch.dict(
+    "os.environ",
+    {
+        "BATCH_JOB_ARRAY_INDEX_VAR_NAME": "AWS_BATCH_JOB_ARRAY_INDEX",
+        "AWS_BATCH_JOB_ARRAY_INDEX": "0",
+        "BATCH_JOB_ARRAY_INDEX_COUNT": "2",
+    },
+)
+@mock.patch("flytekit.bin.entrypoint.load_object_from_module")
+def test_execute_map_task_batch_unreadable_inputs(mock_load_object, tmp_path):
+    @task
+    def identity(a: int) -> int:
+        return a
+
+    mock_load_object.return_value.load_task.return_value = identity
+    output_prefix = tmp_path / "outputs"
+
+    _execute_map_task(
+        inputs=str(tmp_path / "missing_inputs.pb"),
+        output_prefix=str(output_prefix),
+        raw_output_data_prefix=str(tmp_path / "raw"),
+        max_concurrency=None,
+        test=False,
+        resolver="resolver",
+        resolver_args=["task-module", "test", "task-name", "identity"],
+    )
+
+    # Failing to read the batch inputs is reported for every index of the batch.
+    for index in ("0", "1"):
+        assert os.listdir(output_prefix / index) == ["error.pb"]
+        error = utils.load_proto_from_file(ErrorDocument, str(output_prefix / index / "error.pb"))
+        assert error.error.code == "SYSTEM:Unknown"
@@ -1,11 +1,15 @@
+import threading
+import time
 import typing
 from collections import OrderedDict
 
+import mock
 import pytest
 
 from flytekit import LaunchPlan, map_task
 from flytekit.core import context_manager
 from flytekit.core.context_manager import Image, ImageConfig
+from flytekit.core.dynamic_workflow_task import dynamic
 from flytekit.core.map_task import MapPythonTask
 from flytekit.core.task import TaskMetadata, task
 from flytekit.core.workflow import workflow
@@ -66,6 +70,94 @@ def test_map_task_types():
         _ = map_task(t1, metadata=TaskMetadata(retries=1))(a=["invalid", "args"])
 
 
+def test_map_task_concurrency():
+    assert map_task(t1, concurrency=2)(a=[1, 2, 3, 4, 5]) == ["3", "4", "5", "6", "7"]
+
+    # Both instances must be running at the same time for the barrier to be passed.
+    barrier = threading.Barrier(2, timeout=5)
+
+    @task
+    def wait_for_other(a: int) -> int:
+        barrier.wait()
+        return a
+
+    assert map_task(wait_for_other, concurrency=2)(a=[1, 2]) == [1, 2]
+
+
+@pytest.mark.parametrize("concurrency", [0, 1])
+def test_map_task_serial(concurrency):
+    with mock.patch("flytekit.core.map_task.ThreadPoolExecutor") as mock_executor:
+        assert map_task(t1, concurrency=concurrency)(a=[1, 2, 3]) == ["3", "4", "5"]
+        mock_executor.assert_not_called()
+
+
+def test_map_task_concurrency_failure():
+    @task
+    def fails_on_odd(a: int) -> int:
+        if a % 2:
+            raise ValueError(f"odd input {a}")
+        return a
+
+    with pytest.raises(ValueError, match="odd input 1"):
+        map_task(fails_on_odd, concurrency=2)(a=[0, 1, 2, 3, 4])
+
+    second_failed = threading.Event()
+
+    @task
+    def fails_slowly_first(a: int) -> int:
+        if a == 0:
+            second_failed.wait(timeout=5)
+            time.sleep(0.1)
+        else:
+            second_failed.set()
+        raise ValueError(f"failed input {a}")
+
+    # The error of the lowest-index failed instance is raised, even if another instance failed before it.
+    with pytest.raises(ValueError, match="failed input 0"):
+        map_task(fails_slowly_first, concurrency=2)(a=[0, 1])
+
+
+def test_map_dynamic_task_concurrency():
+    @task
+    def plus_one(a: int) -> int:
+        return a + 1
+
+    @dynamic
+    def dynamic_plus_three(a: int) -> int:
+        b = plus_one(a=a)
+        c = plus_one(a=b)
+        return plus_one(a=c)
+
+    @workflow
+    def my_wf(x: typing.List[int]) -> typing.List[int]:
+        return map_task(dynamic_plus_three, concurrency=8)(a=x)
+
+    # Dynamic tasks push execution contexts while they run, so they must not be run on the thread pool.
+    for _ in range(20):
+        assert my_wf(x=list(range(20))) == list(range(3, 23))
+
+
+def test_map_task_array_job_index():
+    mt = map_task(t1)
+    ctx = context_manager.FlyteContextManager.current_context()
+    with mt.array_job_index(1):
+        assert mt._execute_map_task(ctx, a=[5, 6, 7]) == "8"
+    assert mt._array_job_index is None
+
+
+def test_compute_array_job_index():
+    with mock.patch.dict(
+        "os.environ", {"BATCH_JOB_ARRAY_INDEX_VAR_NAME": "AWS_BATCH_JOB_ARRAY_INDEX", "AWS_BATCH_JOB_ARRAY_INDEX": "2"}
+    ):
+        assert MapPythonTask._compute_array_job_index() == 2
+        with mock.patch.dict("os.environ", {"BATCH_JOB_ARRAY_INDEX_OFFSET": "5"}):
+            assert MapPythonTask._compute_array_job_index() == 7
+
+    with mock.patch.dict("os.environ", {}, clear=True):
+        with pytest.raises(KeyError):
+            MapPythonTask._compute_array_job_index()
+
+
 def test_serialization(serialization_settings):
     maptask = map_task(t1, metadata=TaskMetadata(retries=1))
     task_spec = get_serializable(OrderedDict(), serialization_settings, maptask)
@@ -1,7 +1,12 @@
 import mock
 import pandas as pd
+import pyarrow as pa
+import pytest
 
-from flytekit import StructuredDataset, kwtypes, task, workflow
+from flytekit import FlyteContextManager, StructuredDataset, kwtypes, task, workflow
+from flytekit.models import literals
+from flytekit.models.types import StructuredDatasetType
+from flytekit.types.structured.bigquery import BQToArrowDecodingHandler, _bq_client, _bq_read_client
 
 try:
     from typing import Annotated
@@ -35,20 +40,119 @@ def wf() -> pd.DataFrame:
     return t2(sd=sd)
 
 
+@pytest.fixture(autouse=True)
+def clear_bq_clients():
+    # The clients are cached per process, make sure every test picks up its own mocks.
+    _bq_client.cache_clear()
+    _bq_read_client.cache_clear()
+
+
 @mock.patch("google.cloud.bigquery.Client")
 @mock.patch("google.cloud.bigquery_storage.BigQueryReadClient")
 @mock.patch("google.cloud.bigquery_storage_v1.reader.ReadRowsStream")
 def test_bq_wf(mock_read_rows_stream, mock_bigquery_read_client, mock_client):
-    class mock_pages:
-        def to_dataframe(self):
-            return pd.DataFrame({"Name": ["Tom", "Joseph"], "Age": [20, 22]})
-
     class mock_rows:
-        pages = [mock_pages()]
+        def to_arrow(self):
+            return pa.Table.from_pandas(pd_df)
 
     mock_client.load_table_from_dataframe.return_value = None
-    mock_read_rows_stream.rows.return_value = mock_rows
+    mock_read_rows_stream.rows.return_value = mock_rows()
     mock_bigquery_read_client.read_rows.return_value = mock_read_rows_stream
+    mock_bigquery_read_client.create_read_session.return_value.streams = [mock.MagicMock()]
     mock_bigquery_read_client.return_value = mock_bigquery_read_client
 
     assert wf().equals(pd_df)
+
+
+@mock.patch("google.cloud.bigquery.Client")
+def test_arrow_to_bq(mock_client):
+    @task
+    def t3() -> Annotated[StructuredDataset, my_cols]:
+        return StructuredDataset(dataframe=pa.Table.from_pandas(pd_df), uri="bq://project:flyte.table")
+
+    t3()
+    mock_client.return_value.load_table_from_file.assert_called_once()
+    mock_client.return_value.load_table_from_dataframe.assert_not_called()
+
+
+@mock.patch("google.cloud.bigquery_storage.BigQueryReadClient")
+def test_bq_to_arrow(mock_bigquery_read_client):
+    mock_bigquery_read_client.return_value = mock_bigquery_read_client
+    mock_bigquery_read_client.create_read_session.return_value.streams = [mock.MagicMock()]
+    mock_bigquery_read_client.read_rows.return_value.rows.return_value.to_arrow.return_value = pa.Table.from_pandas(
+        pd_df
+    )
+
+    sd = literals.StructuredDataset(
+        uri="bq://project:flyte.table",
+        metadata=literals.StructuredDatasetMetadata(StructuredDatasetType(columns=[])),
+    )
+    table = BQToArrowDecodingHandler().decode(FlyteContextManager.current_context(), sd)
+    assert isinstance(table, pa.Table)
+    assert table.to_pandas().equals(pd_df)
+
+
+@mock.patch("google.cloud.bigquery_storage.BigQueryReadClient")
+def test_bq_to_arrow_multiple_streams(mock_bigquery_read_client):
+    stream_tables = {
+        "stream-0": pa.table({"Name": ["Tom"], "Age": [20]}),
+        "stream-1": pa.table({"Name": ["Joseph"], "Age": [22]}),
+    }
+
+    def read_rows(name):
+        reader = mock.MagicMock()
+        reader.rows.return_value.to_arrow.return_value = stream_tables[name]
+        return reader
+
+    streams = []
+    for name in stream_tables:
+        stream = mock.MagicMock()
+        stream.name = name
+        streams.append(stream)
+
+    mock_bigquery_read_client.return_value = mock_bigquery_read_client
+    mock_bigquery_read_client.create_read_session.return_value.streams = streams
+    mock_bigquery_read_client.read_rows.side_effect = read_rows
+
+    sd = literals.StructuredDataset(
+        uri="bq://project:flyte.table",
+        metadata=literals.StructuredDatasetMetadata(StructuredDatasetType(columns=[])),
+    )
+    table = BQToArrowDecodingHandler().decode(FlyteContextManager.current_context(), sd)
+    assert table.to_pandas().equals(pd_df)
+
+
+@mock.patch("google.cloud.bigquery_storage.BigQueryReadClient")
+def test_bq_to_arrow_no_streams(mock_bigquery_read_client):
+    schema = pa.schema([("Name", pa.string()), ("Age", pa.int64())])
+    mock_bigquery_read_client.return_value = mock_bigquery_read_client
+    read_session = mock_bigquery_read_client.create_read_session.return_value
+    read_session.streams = []
+    read_session.arrow_schema.serialized_schema = schema.serialize().to_pybytes()
+
+    sd = literals.StructuredDataset(
+        uri="bq://project:flyte.table",
+        metadata=literals.StructuredDatasetMetadata(StructuredDatasetType(columns=[])),
+    )
+    table = BQToArrowDecodingHandler().decode(FlyteContextManager.current_context(), sd)
+    assert table.num_rows == 0
+    assert table.schema.equals(schema)
+    mock_bigquery_read_client.read_rows.assert_not_called()
+
+
+@pytest.mark.parametrize("uri", ["bq://project:flyte.table", "bq://project.flyte.table"])
+@mock.patch("google.cloud.bigquery_storage.BigQueryReadClient")
+def test_bq_uri_forms(mock_bigquery_read_client, uri):
+    mock_bigquery_read_client.return_value = mock_bigquery_read_client
+    mock_bigquery_read_client.create_read_session.return_value.streams = [mock.MagicMock()]
+    mock_bigquery_read_client.read_rows.return_value.rows.return_value.to_arrow.return_value = pa.Table.from_pandas(
+        pd_df
+    )
+
+    sd = literals.StructuredDataset(
+        uri=uri, metadata=literals.StructuredDatasetMetadata(StructuredDatasetType(columns=[]))
+    )
+    BQToArrowDecodingHandler().decode(FlyteContextManager.current_context(), sd)
+    _, kwargs = mock_bigquery_read_client.create_read_session.call_args
+    assert kwargs["parent"] == "projects/project"
+    assert kwargs["read_session"].table == "projects/project/datasets/flyte/tables/table"